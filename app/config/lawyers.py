@@ -5,6 +5,7 @@ Configuration file for lawyer contact information and notifications.
 This file contains the list of lawyers who should receive lead notifications.
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any
 
 # Lawyer contact configuration
@@ -35,6 +36,7 @@ def get_lawyers_for_notification() -> List[Dict[str, Any]]:
     """
     return LAWYERS
 
+@lru_cache(maxsize=256)
 def format_lawyer_phone_for_whatsapp(phone: str) -> str:
     """
     Format phone number for WhatsApp messaging.
@@ -7,8 +7,9 @@ error handling, and route registration.
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+from prometheus_fastapi_instrumentator import Instrumentator
 import logging
 import os
 from dotenv import load_dotenv
@@ -18,10 +19,12 @@ from app.routes.chat import router as chat_router
 from app.routes.conversation import router as conversation_router
 from app.routes.whatsapp import router as whatsapp_router
 from app.routes.leads import router as leads_router
+from app.routes.whatsapp_admin import router as whatsapp_admin_router
 
 # Import services for startup
 from app.services.firebase_service import initialize_firebase
 from app.services.baileys_service import baileys_service
+from app.services.redis_service import close_redis_client
 
 # Load environment variables from .env file
 load_dotenv()
@@ -37,7 +40,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Law Firm AI Chat Backend",
     description="Production-ready FastAPI backend for law firm client intake with WhatsApp integration",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -61,6 +65,13 @@ app.include_router(conversation_router, prefix="/api/v1", tags=["Conversation"])
 app.include_router(whatsapp_router, prefix="/api/v1", tags=["WhatsApp"])
 app.include_router(leads_router, prefix="/api/v1", tags=["Leads"])
 
+# Prometheus metrics (per-route request latency + custom histograms) at /metrics
+Instrumentator().instrument(app).expose(app, include_in_schema=False)
+
+# Test/maintenance endpoints are only exposed when explicitly enabled
+if os.getenv("ENABLE_ADMIN_ROUTES", "false").lower() == "true":
+    app.include_router(whatsapp_admin_router, prefix="/api/v1", tags=["WhatsApp Admin"])
+
 # -------------------------
 # Startup & Shutdown Events
 # -------------------------
@@ -100,6 +111,7 @@ async def shutdown_event():
     logger.info("📴 Shutting down FastAPI application...")
     try:
         await baileys_service.cleanup()
+        await close_redis_client()
         logger.info("✅ Services cleaned up successfully")
     except Exception as e:
         logger.warning(f"⚠️ Cleanup warning: {str(e)}")
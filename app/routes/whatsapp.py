@@ -7,8 +7,11 @@ to the backend AI for intelligent processing.
 """
 
 import logging
+import orjson
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from prometheus_client import Histogram
 
 from app.services.orchestration_service import intelligent_orchestrator
 from app.services.baileys_service import (
@@ -17,6 +20,8 @@ from app.services.baileys_service import (
     baileys_service
 )
 from app.services.lawyer_notification_service import lawyer_notification_service
+from app.services.redis_service import set_if_absent
+from app.services.whatsapp_notification_service import check_notification_status
 
 # Logging
 logger = logging.getLogger(__name__)
@@ -24,15 +29,39 @@ logger = logging.getLogger(__name__)
 # FastAPI router
 router = APIRouter()
 
+# Per-phase latency of WhatsApp message handling
+WEBHOOK_LATENCY = Histogram(
+    "whatsapp_webhook_seconds",
+    "Time spent in each phase of WhatsApp webhook processing",
+    ["phase"]
+)
+
+# How long a processed messageId is remembered for replay deduplication
+WEBHOOK_DEDUP_TTL_SECONDS = 600
+
+# Message sent to the law firm when the chatbot suggests a WhatsApp contact
+SUGGEST_CONTACT_TEMPLATE = """🔔 *Nova Lead do Chatbot AI*
+
+👤 *Cliente:* {user_name}
+🆔 *Sessão:* {session_id}
+⏰ *Horário:* {timestamp}
+🤖 *Origem:* Conversa inteligente com IA
+
+O cliente interagiu com nosso assistente AI e demonstrou interesse em nossos serviços jurídicos.
+
+_Mensagem enviada automaticamente pelo sistema._"""
+
 
 @router.post("/whatsapp/webhook")
-async def whatsapp_webhook(request: Request):
+async def whatsapp_webhook(request: Request, background_tasks: BackgroundTasks):
     """
     Webhook endpoint for receiving WhatsApp messages via Baileys.
-    Processes messages through AI (no Firebase flow repetition).
+    Acknowledges immediately and processes the message through AI in the
+    background; the reply is sent back via Baileys once it is ready.
     """
     try:
-        payload = await request.json()
+        with WEBHOOK_LATENCY.labels("parse").time():
+            payload = orjson.loads(await request.body())
         logger.info(f"📨 Received WhatsApp webhook: {payload}")
 
         # Extract message details
@@ -45,50 +74,67 @@ async def whatsapp_webhook(request: Request):
             logger.warning("⚠️ Invalid webhook payload - missing message or phone number")
             return {"status": "error", "message": "Invalid payload"}
 
-        logger.info(f"🎯 Processing WhatsApp message from {phone_number}: {message_text[:50]}...")
+        # Skip replays of a message that was already accepted (Baileys/proxy retries)
+        with WEBHOOK_LATENCY.labels("dedup").time():
+            is_new_message = not message_id or await set_if_absent(f"wh:msg:{message_id}", WEBHOOK_DEDUP_TTL_SECONDS)
+        if not is_new_message:
+            logger.info(f"🔁 Duplicate WhatsApp message {message_id} ignored")
+            return {"status": "duplicate", "message_id": message_id}
 
-        # Process via Intelligent Orchestrator (WhatsApp platform - AI only)
-        response = await intelligent_orchestrator.process_message(
-            message_text,
-            session_id,
-            phone_number=phone_number,
-            platform="whatsapp"
+        logger.info(f"🎯 Queueing WhatsApp message from {phone_number}: {message_text[:50]}...")
+        background_tasks.add_task(_process_and_reply, message_text, session_id, phone_number)
+
+        return ORJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "status": "accepted",
+                "message_id": message_id,
+                "session_id": session_id
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"❌ Error processing WhatsApp webhook: {str(e)}")
+        # Non-2xx so the bot sends its own fallback reply to the user
+        return ORJSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"status": "error", "message": str(e)}
         )
 
+
+async def _process_and_reply(message_text: str, session_id: str, phone_number: str):
+    """
+    Process a WhatsApp message via the Intelligent Orchestrator and send
+    the reply through Baileys (runs as a background task).
+    """
+    try:
+        # Process via Intelligent Orchestrator (WhatsApp platform - AI only)
+        with WEBHOOK_LATENCY.labels("orchestrator").time():
+            response = await intelligent_orchestrator.process_message(
+                message_text,
+                session_id,
+                phone_number=phone_number,
+                platform="whatsapp"
+            )
+
         # The response contains AI-generated reply (no Firebase flow)
         ai_response = response.get("response", "")
-        
+
         if ai_response:
             logger.info(f"🤖 Sending AI response to {phone_number}")
             logger.debug(f"AI Response: {ai_response[:100]}...")
-            
-            # Response is sent by the WhatsApp bot automatically
-            # We just return the response data for the bot to handle
-            return {
-                "status": "success",
-                "message_id": message_id,
-                "session_id": session_id,
-                "response": ai_response,
-                "response_type": response.get("response_type", "ai_whatsapp"),
-                "message_count": response.get("message_count", 1)
-            }
         else:
             logger.warning("⚠️ No AI response generated")
-            return {
-                "status": "success",
-                "message_id": message_id,
-                "session_id": session_id,
-                "response": "Obrigado pela sua mensagem. Nossa equipe entrará em contato em breve.",
-                "response_type": "fallback"
-            }
+            ai_response = "Obrigado pela sua mensagem. Nossa equipe entrará em contato em breve."
 
     except Exception as e:
-        logger.error(f"❌ Error processing WhatsApp webhook: {str(e)}")
-        return {
-            "status": "error", 
-            "message": str(e),
-            "response": "Desculpe, ocorreu um erro interno. Nossa equipe foi notificada e entrará em contato em breve."
-        }
+        logger.error(f"❌ Error processing WhatsApp message for session {session_id}: {str(e)}")
+        ai_response = "Desculpe, ocorreu um erro interno. Nossa equipe foi notificada e entrará em contato em breve."
+
+    with WEBHOOK_LATENCY.labels("reply").time():
+        success = await send_baileys_message(phone_number, ai_response)
+    if not success:
+        logger.error(f"❌ Failed to deliver WhatsApp reply to {phone_number}")
 
 
 @router.post("/whatsapp/send")
@@ -166,56 +212,12 @@ async def whatsapp_status():
         }
 
 
-@router.post("/whatsapp/test-lawyer-notifications")
-async def test_lawyer_notifications():
-    """
-    Test endpoint to verify lawyer notification system with duplicate prevention.
-    """
-    try:
-        logger.info("🧪 Testing lawyer notification system")
-        
-        # Create test lead data
-        test_lead_data = {
-            "answers": [
-                {"id": 1, "answer": "João Silva (TESTE)"},
-                {"id": 2, "answer": "Penal"},
-                {"id": 3, "answer": "Teste do sistema de notificações sem duplicatas"},
-                {"id": 4, "answer": "11999999999"}
-            ]
-        }
-        
-        # Save test lead (this will trigger notification automatically)
-        from app.services.firebase_service import save_lead_data
-        lead_id = await save_lead_data(test_lead_data)
-        
-        # Check notification status
-        from app.services.whatsapp_notification_service import check_notification_status
-        status = await check_notification_status(lead_id)
-        
-        return {
-            "status": "success",
-            "message": "Test lead created and notification sent (if enabled)",
-            "lead_id": lead_id,
-            "notification_status": status,
-            "whatsapp_enabled": os.getenv("ENABLE_WHATSAPP", "false").lower() == "true"
-        }
-        
-    except Exception as e:
-        logger.error(f"❌ Error testing lawyer notifications: {str(e)}")
-        return {
-            "status": "error",
-            "message": "Failed to test lawyer notifications",
-            "error": str(e)
-        }
-
-
 @router.post("/whatsapp/check-notification/{lead_id}")
 async def check_lead_notification_status(lead_id: str):
     """
     Check if a lead has been notified via WhatsApp.
     """
     try:
-        from app.services.whatsapp_notification_service import check_notification_status
         status = await check_notification_status(lead_id)
         return status
         
@@ -228,29 +230,6 @@ async def check_lead_notification_status(lead_id: str):
         }
 
 
-@router.post("/whatsapp/reset-notification/{lead_id}")
-async def reset_lead_notification_status(lead_id: str):
-    """
-    Reset notification status for a lead (for testing purposes).
-    """
-    try:
-        from app.services.whatsapp_notification_service import reset_notification_status
-        success = await reset_notification_status(lead_id)
-        
-        return {
-            "success": success,
-            "message": f"Notification status reset for lead {lead_id}" if success else "Failed to reset notification status",
-            "lead_id": lead_id
-        }
-        
-    except Exception as e:
-        logger.error(f"❌ Error resetting notification status: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
-
 @router.post("/whatsapp/suggest-contact")
 async def suggest_whatsapp_contact(session_id: str, user_name: str = "Cliente"):
     """
@@ -261,18 +240,11 @@ async def suggest_whatsapp_contact(session_id: str, user_name: str = "Cliente"):
         logger.info(f"📲 Suggesting WhatsApp contact for session: {session_id}")
 
         # Message to law firm
-        notification_message = f"""
-🔔 *Nova Lead do Chatbot AI*
-
-👤 *Cliente:* {user_name}
-🆔 *Sessão:* {session_id}
-⏰ *Horário:* {datetime.now().strftime('%d/%m/%Y às %H:%M')}
-🤖 *Origem:* Conversa inteligente com IA
-
-O cliente interagiu com nosso assistente AI e demonstrou interesse em nossos serviços jurídicos.
-
-_Mensagem enviada automaticamente pelo sistema._
-        """.strip()
+        notification_message = SUGGEST_CONTACT_TEMPLATE.format(
+            user_name=user_name,
+            session_id=session_id,
+            timestamp=datetime.now().strftime('%d/%m/%Y às %H:%M')
+        )
 
         # Send to law firm number
         success = await send_baileys_message("+5511918368812", notification_message)
@@ -0,0 +1,85 @@
+"""
+WhatsApp Admin Routes
+
+Test and maintenance endpoints for the lawyer notification system.
+Only mounted when ENABLE_ADMIN_ROUTES=true (see app/main.py).
+"""
+
+import logging
+from fastapi import APIRouter
+
+from app.services.firebase_service import save_lead_data
+from app.services.whatsapp_notification_service import (
+    WHATSAPP_ENABLED,
+    check_notification_status,
+    reset_notification_status
+)
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# FastAPI router
+router = APIRouter()
+
+
+@router.post("/whatsapp/test-lawyer-notifications")
+async def test_lawyer_notifications():
+    """
+    Test endpoint to verify lawyer notification system with duplicate prevention.
+    """
+    try:
+        logger.info("🧪 Testing lawyer notification system")
+        
+        # Create test lead data
+        test_lead_data = {
+            "answers": [
+                {"id": 1, "answer": "João Silva (TESTE)"},
+                {"id": 2, "answer": "Penal"},
+                {"id": 3, "answer": "Teste do sistema de notificações sem duplicatas"},
+                {"id": 4, "answer": "11999999999"}
+            ]
+        }
+        
+        # Save test lead (this will trigger notification automatically)
+        lead_id = await save_lead_data(test_lead_data)
+        
+        # Check notification status
+        status = await check_notification_status(lead_id)
+        
+        return {
+            "status": "success",
+            "message": "Test lead created and notification sent (if enabled)",
+            "lead_id": lead_id,
+            "notification_status": status,
+            "whatsapp_enabled": WHATSAPP_ENABLED
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error testing lawyer notifications: {str(e)}")
+        return {
+            "status": "error",
+            "message": "Failed to test lawyer notifications",
+            "error": str(e)
+        }
+
+
+@router.post("/whatsapp/reset-notification/{lead_id}")
+async def reset_lead_notification_status(lead_id: str):
+    """
+    Reset notification status for a lead (for testing purposes).
+    """
+    try:
+        success = await reset_notification_status(lead_id)
+        
+        return {
+            "success": success,
+            "message": f"Notification status reset for lead {lead_id}" if success else "Failed to reset notification status",
+            "lead_id": lead_id
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error resetting notification status: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
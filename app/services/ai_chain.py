@@ -233,6 +233,13 @@ Você **não agenda consultas**, apenas coleta as informações e organiza para
             "ou agende uma consulta presencial."
         )
 
+    def add_to_session_memory(self, session_id: str, message: str, response: str):
+        """Record an exchange that was answered without calling the LLM."""
+        self._get_session_history(session_id)
+        memory = conversation_memories[session_id]
+        memory.chat_memory.add_user_message(message)
+        memory.chat_memory.add_ai_message(response)
+
     def clear_session_memory(self, session_id: str):
         """Clear memory for a specific session."""
         if session_id in conversation_memories:
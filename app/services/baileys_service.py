@@ -5,7 +5,7 @@ This service communicates with the dedicated `whatsapp_bot` container over HTTP.
 It handles message sending, status checking, and connection management.
 """
 
-import requests
+import httpx
 import logging
 import asyncio
 import json
@@ -14,11 +14,30 @@ import os
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
 class BaileysWhatsAppService:
     def __init__(self, base_url: str = None):
         self.base_url = base_url or os.getenv("WHATSAPP_BOT_URL", "http://whatsapp_bot:3000")
         self.timeout = 30
         self.max_retries = 3
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it on first use.
+        
+        HTTP/2 is negotiated via ALPN, so requests are multiplexed over one
+        connection when the bot is served over TLS by an HTTP/2 proxy; plain
+        http:// URLs keep using pooled HTTP/1.1 keep-alive connections.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+            )
+        return self._client
         
     async def initialize(self):
         """Initialize connection to WhatsApp bot service."""
@@ -28,12 +47,7 @@ class BaileysWhatsAppService:
             # Test connection with retries
             for attempt in range(self.max_retries):
                 try:
-                    import asyncio
-                    loop = asyncio.get_event_loop()
-                    response = await loop.run_in_executor(
-                        None, 
-                        lambda: requests.get(f"{self.base_url}/health", timeout=10)
-                    )
+                    response = await self._get_client().get(f"{self.base_url}/health", timeout=10)
                     if response.status_code == 200:
                         logger.info("✅ WhatsApp bot service connection established")
                         return True
@@ -53,42 +67,44 @@ class BaileysWhatsAppService:
     async def cleanup(self):
         """Cleanup resources."""
         logger.info("🧹 Cleaning up WhatsApp service resources")
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
 
     async def send_whatsapp_message(self, phone_number: str, message: str) -> bool:
         """
         Send a WhatsApp message via whatsapp_bot API.
         
         Args:
-            phone_number (str): Phone number in format like "5511999999999@s.whatsapp.net"
+            phone_number (str): Full JID (e.g. "5511999999999@s.whatsapp.net",
+                group "...@g.us", "...@lid") or a bare phone number
             message (str): Message to send
             
         Returns:
             bool: True if message was sent successfully
         """
         try:
-            # Ensure phone number has correct format
-            if "@s.whatsapp.net" not in phone_number:
+            # Normalize bare phone numbers; JIDs (anything with "@") are sent as-is
+            if "@" not in phone_number:
                 # Clean phone number and add WhatsApp format
                 clean_phone = ''.join(filter(str.isdigit, phone_number))
                 if not clean_phone.startswith("55"):
                     clean_phone = f"55{clean_phone}"
                 phone_number = f"{clean_phone}@s.whatsapp.net"
             
-            payload = {
-                "to": phone_number,
-                "message": message
-            }
+            # Encode as raw UTF-8 instead of ASCII-escaped JSON:
+            # accents and emojis would otherwise cost 6-12 bytes each
+            body = json.dumps(
+                {"to": phone_number, "message": message},
+                ensure_ascii=False
+            ).encode("utf-8")
             
             logger.info(f"📤 Sending WhatsApp message to {phone_number[:15]}...")
             
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.post(
-                    f"{self.base_url}/send-message",
-                    json=payload,
-                    timeout=self.timeout
-                )
+            response = await self._get_client().post(
+                f"{self.base_url}/send-message",
+                content=body,
+                headers=JSON_HEADERS
             )
             
             if response.status_code == 200:
@@ -103,10 +119,10 @@ class BaileysWhatsAppService:
                 logger.error(f"❌ WhatsApp API request failed with status {response.status_code}: {response.text}")
                 return False
                 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error("⏰ WhatsApp message request timed out")
             return False
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             logger.error("🔌 Failed to connect to WhatsApp bot service")
             return False
         except Exception as e:
@@ -121,11 +137,7 @@ class BaileysWhatsAppService:
             Dict[str, Any]: Status information
         """
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(f"{self.base_url}/api/qr-status", timeout=10)
-            )
+            response = await self._get_client().get(f"{self.base_url}/api/qr-status", timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -146,7 +158,7 @@ class BaileysWhatsAppService:
                     "error": f"HTTP {response.status_code}"
                 }
                 
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             return {
                 "status": "service_unavailable",
                 "service": "baileys_whatsapp", 
@@ -170,11 +182,7 @@ class BaileysWhatsAppService:
             Dict[str, Any]: Health status
         """
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(f"{self.base_url}/health", timeout=10)
-            )
+            response = await self._get_client().get(f"{self.base_url}/health", timeout=10)
             
             if response.status_code == 200:
                 return response.json()
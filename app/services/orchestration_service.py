@@ -2,6 +2,7 @@ import logging
 import json
 import os
 import asyncio
+import hashlib
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 from app.services.firebase_service import (
@@ -14,9 +15,18 @@ from app.services.firebase_service import (
 from app.services.ai_chain import ai_orchestrator
 from app.services.baileys_service import baileys_service
 from app.services.lawyer_notification_service import lawyer_notification_service
+from app.services.redis_service import cache_get, cache_set
 
 logger = logging.getLogger(__name__)
 
+# TTL for cached AI replies to opening WhatsApp messages ("oi", "bom dia", ...)
+AI_RESPONSE_CACHE_TTL_SECONDS = 300
+
+
+def _ai_response_cache_key(message: str) -> str:
+    digest = hashlib.blake2b(message.lower().strip().encode(), digest_size=16).hexdigest()
+    return f"ai:{digest}"
+
 
 def ensure_utc(dt: datetime) -> datetime:
     if dt is None:
@@ -690,15 +700,28 @@ Perfeito! Suas informações foram registradas com sucesso. Nossa equipe entrar
                         "situation": lead_data.get("situation", lead_data.get("step_3", "Não detalhada"))
                     }
                     
-                    # Call AI with timeout
-                    ai_response = await asyncio.wait_for(
-                        ai_orchestrator.generate_response(
-                            message,
-                            session_id,
-                            context=context
-                        ),
-                        timeout=self.gemini_timeout
-                    )
+                    # Opening messages of a fresh session have no per-user context,
+                    # so their replies can be shared across sessions
+                    cacheable = not lead_data and session_data.get("message_count", 0) == 0
+                    cache_key = _ai_response_cache_key(message) if cacheable else None
+                    ai_response = await cache_get(cache_key) if cache_key else None
+                    
+                    if ai_response:
+                        logger.info(f"⚡ Using cached AI response for session {session_id}")
+                        ai_orchestrator.add_to_session_memory(session_id, message, ai_response)
+                    else:
+                        # Call AI with timeout
+                        ai_response = await asyncio.wait_for(
+                            ai_orchestrator.generate_response(
+                                message,
+                                session_id,
+                                context=context
+                            ),
+                            timeout=self.gemini_timeout
+                        )
+                        
+                        if cache_key and ai_response and isinstance(ai_response, str) and ai_response.strip():
+                            await cache_set(cache_key, ai_response, AI_RESPONSE_CACHE_TTL_SECONDS)
                     
                     if ai_response and isinstance(ai_response, str) and ai_response.strip():
                         session_data["last_message"] = message
@@ -0,0 +1,128 @@
+"""
+Redis Service
+
+Shared async Redis client used for short-lived coordination keys
+(webhook idempotency, response caching, locks).
+
+Redis is optional: when REDIS_URL is not configured or Redis is unreachable,
+helpers degrade to "no cache / no dedup" so message processing never fails
+because of Redis. Short socket timeouts turn a stalled Redis into an error
+(and thus the same fallback) instead of an indefinite wait.
+"""
+
+import os
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+# Global Redis client (holds its own connection pool)
+_redis_client: Optional[redis.Redis] = None
+
+# Seconds to wait for connect / each command before falling back
+REDIS_CONNECT_TIMEOUT_SECONDS = 1
+REDIS_SOCKET_TIMEOUT_SECONDS = 1
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """
+    Return the shared Redis client, or None if REDIS_URL is not configured.
+    """
+    global _redis_client
+
+    if _redis_client is None:
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            return None
+        _redis_client = redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS
+        )
+        logger.info("🔌 Redis client configured")
+
+    return _redis_client
+
+
+async def close_redis_client():
+    """Close the shared Redis client and its connection pool."""
+    global _redis_client
+
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+async def set_if_absent(key: str, ttl_seconds: int) -> bool:
+    """
+    Atomically create `key` with a TTL if it does not exist yet (SET NX EX).
+
+    Args:
+        key (str): Redis key
+        ttl_seconds (int): Expiration in seconds
+
+    Returns:
+        bool: True if the key was created (or Redis is unavailable),
+              False if it already existed
+    """
+    client = get_redis_client()
+    if client is None:
+        return True
+
+    try:
+        return bool(await client.set(key, "1", nx=True, ex=ttl_seconds))
+    except Exception as e:
+        logger.warning(f"⚠️ Redis SET NX failed for {key}: {str(e)}")
+        return True
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """
+    Read a cached value.
+
+    Returns:
+        Optional[str]: Cached value, or None on miss / Redis unavailable
+    """
+    client = get_redis_client()
+    if client is None:
+        return None
+
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning(f"⚠️ Redis GET failed for {key}: {str(e)}")
+        return None
+
+
+async def cache_set(key: str, value: str, ttl_seconds: int) -> bool:
+    """
+    Store a value with a TTL (SETEX).
+
+    Returns:
+        bool: True if the value was stored
+    """
+    client = get_redis_client()
+    if client is None:
+        return False
+
+    try:
+        await client.setex(key, ttl_seconds, value)
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Redis SETEX failed for {key}: {str(e)}")
+        return False
+
+
+async def delete_key(key: str) -> None:
+    """Delete a key (e.g. to release a lock); errors are logged and ignored."""
+    client = get_redis_client()
+    if client is None:
+        return
+
+    try:
+        await client.delete(key)
+    except Exception as e:
+        logger.warning(f"⚠️ Redis DELETE failed for {key}: {str(e)}")
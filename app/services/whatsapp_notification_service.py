@@ -6,16 +6,54 @@ Only sends notifications once per lead and respects environment flags.
 """
 
 import os
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
+from dotenv import load_dotenv
+from prometheus_client import Histogram
 
 from app.services.firebase_service import get_firestore_client
 from app.services.baileys_service import baileys_service
+from app.services.redis_service import set_if_absent, delete_key
 from app.config.lawyers import get_lawyers_for_notification, format_lawyer_phone_for_whatsapp
 
+# Load environment variables (this module may be imported before main.py loads .env)
+load_dotenv()
+
 logger = logging.getLogger(__name__)
 
+# WhatsApp notifications toggle, read once at import
+WHATSAPP_ENABLED = os.getenv("ENABLE_WHATSAPP", "false").lower() == "true"
+
+# Upper bound for one notification run (Baileys send timeout is 30s)
+NOTIFY_LOCK_TTL_SECONDS = 60
+
+# Per-phase latency of new-lead notifications
+NOTIFICATION_LATENCY = Histogram(
+    "lead_notification_seconds",
+    "Time spent in each phase of new-lead WhatsApp notification",
+    ["phase"]
+)
+
+# Message sent to lawyers for each new lead
+LEAD_NOTIFICATION_TEMPLATE = """🚨 *Novo Cliente Recebido!*
+
+👤 *Nome:* {lead_name}
+📞 *Telefone:* {lead_phone}
+⚖️ *Área:* {area}
+📝 *Situação:* {situation}
+
+🆔 *Lead ID:* {lead_id}
+⏰ *Recebido em:* {received_at}
+
+_Mensagem enviada automaticamente pelo sistema de captação de leads._"""
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """Cut text to max_length characters, adding an ellipsis if it was longer."""
+    return text if len(text) <= max_length else text[:max_length] + "..."
+
 
 async def send_new_lead_notification(lead_id: str, lead_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -30,8 +68,7 @@ async def send_new_lead_notification(lead_id: str, lead_data: Dict[str, Any]) ->
     """
     try:
         # Check if WhatsApp notifications are enabled
-        whatsapp_enabled = os.getenv("ENABLE_WHATSAPP", "false").lower() == "true"
-        if not whatsapp_enabled:
+        if not WHATSAPP_ENABLED:
             logger.info(f"📵 WhatsApp notifications disabled (ENABLE_WHATSAPP=false) for lead {lead_id}")
             return {
                 "success": False,
@@ -39,72 +76,20 @@ async def send_new_lead_notification(lead_id: str, lead_data: Dict[str, Any]) ->
                 "message": "WhatsApp notifications are disabled via environment variable"
             }
         
-        # Check if lead was already notified
-        db = get_firestore_client()
-        lead_ref = db.collection("leads").document(lead_id)
-        lead_doc = lead_ref.get()
-        
-        if not lead_doc.exists:
-            logger.error(f"❌ Lead {lead_id} not found in database")
-            return {
-                "success": False,
-                "reason": "lead_not_found",
-                "message": f"Lead {lead_id} not found"
-            }
-        
-        lead_record = lead_doc.to_dict()
-        
-        # Check if already notified
-        if lead_record.get("was_notified", False):
-            logger.info(f"📵 Lead {lead_id} already notified, skipping duplicate notification")
+        # Only one notification run per lead at a time (check + send + mark is not atomic)
+        lock_key = f"lock:notify:{lead_id}"
+        if not await set_if_absent(lock_key, NOTIFY_LOCK_TTL_SECONDS):
+            logger.info(f"🔒 Notification for lead {lead_id} already in progress, skipping")
             return {
                 "success": False,
-                "reason": "already_notified",
-                "message": f"Lead {lead_id} was already notified"
+                "reason": "in_progress",
+                "message": f"Notification for lead {lead_id} is already in progress"
             }
         
-        # Extract lead information
-        answers = lead_data.get("answers", [])
-        lead_name = "Cliente não identificado"
-        lead_phone = "Não informado"
-        area = "Não informada"
-        situation = "Não detalhada"
-        
-        # Parse answers to extract information
-        for answer in answers:
-            answer_id = answer.get("id", 0)
-            answer_text = answer.get("answer", "")
-            
-            if answer_id == 1:  # Name
-                lead_name = answer_text
-            elif answer_id == 2:  # Area
-                area = answer_text
-            elif answer_id == 3:  # Situation
-                situation = answer_text
-            elif answer_id >= 4 and answer_text.isdigit():  # Phone (usually last numeric answer)
-                lead_phone = answer_text
-        
-        logger.info(f"📨 Sending WhatsApp notification for new lead: {lead_name} ({area})")
-        
-        # Send notifications to all lawyers
-        notification_result = await _send_notifications_to_lawyers(
-            lead_id, lead_name, lead_phone, area, situation
-        )
-        
-        # Mark as notified if at least one notification was sent successfully
-        if notification_result.get("notifications_sent", 0) > 0:
-            try:
-                lead_ref.update({
-                    "was_notified": True,
-                    "notified_at": datetime.now(timezone.utc),
-                    "notification_result": notification_result,
-                    "updated_at": datetime.now(timezone.utc)
-                })
-                logger.info(f"✅ Lead {lead_id} marked as notified")
-            except Exception as update_error:
-                logger.error(f"❌ Error updating notification status: {str(update_error)}")
-        
-        return notification_result
+        try:
+            return await _notify_new_lead(lead_id, lead_data)
+        finally:
+            await delete_key(lock_key)
         
     except Exception as e:
         logger.error(f"❌ Error in send_new_lead_notification: {str(e)}")
@@ -116,6 +101,101 @@ async def send_new_lead_notification(lead_id: str, lead_data: Dict[str, Any]) ->
         }
 
 
+async def _notify_new_lead(lead_id: str, lead_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Notify lawyers about a lead unless it was already notified, then mark it.
+    
+    Args:
+        lead_id (str): ID of the lead
+        lead_data (Dict[str, Any]): Lead data from the conversation
+        
+    Returns:
+        Dict[str, Any]: Notification result
+    """
+    # Check if lead was already notified
+    db = get_firestore_client()
+    lead_ref = db.collection("leads").document(lead_id)
+    with NOTIFICATION_LATENCY.labels("firestore_read").time():
+        lead_doc = await asyncio.to_thread(lead_ref.get)
+    
+    if not lead_doc.exists:
+        logger.error(f"❌ Lead {lead_id} not found in database")
+        return {
+            "success": False,
+            "reason": "lead_not_found",
+            "message": f"Lead {lead_id} not found"
+        }
+    
+    lead_record = lead_doc.to_dict()
+    
+    # Check if already notified
+    if lead_record.get("was_notified", False):
+        logger.info(f"📵 Lead {lead_id} already notified, skipping duplicate notification")
+        return {
+            "success": False,
+            "reason": "already_notified",
+            "message": f"Lead {lead_id} was already notified"
+        }
+    
+    # Extract lead information
+    lead_name, lead_phone, area, situation = _parse_lead_answers(lead_data.get("answers", []))
+    
+    logger.info(f"📨 Sending WhatsApp notification for new lead: {lead_name} ({area})")
+    
+    # Send notifications to all lawyers
+    with NOTIFICATION_LATENCY.labels("send").time():
+        notification_result = await _send_notifications_to_lawyers(
+            lead_id, lead_name, lead_phone, area, situation
+        )
+    
+    # Mark as notified if at least one notification was sent successfully
+    if notification_result.get("notifications_sent", 0) > 0:
+        try:
+            notified_at = datetime.now(timezone.utc)
+            with NOTIFICATION_LATENCY.labels("firestore_update").time():
+                await asyncio.to_thread(lead_ref.update, {
+                    "was_notified": True,
+                    "notified_at": notified_at,
+                    "notification_result": notification_result,
+                    "updated_at": notified_at
+                })
+            logger.info(f"✅ Lead {lead_id} marked as notified")
+        except Exception as update_error:
+            logger.error(f"❌ Error updating notification status: {str(update_error)}")
+    
+    return notification_result
+
+
+def _parse_lead_answers(answers: List[Dict[str, Any]]) -> Tuple[str, str, str, str]:
+    """
+    Extract name, phone, area and situation from intake answers.
+    
+    Args:
+        answers (List[Dict[str, Any]]): Answers as saved on the lead ({"id", "answer"})
+        
+    Returns:
+        Tuple[str, str, str, str]: (lead_name, lead_phone, area, situation)
+    """
+    # Answers indexed by step id (last answer wins for repeated ids)
+    by_id = {answer.get("id", 0): answer.get("answer", "") for answer in answers}
+    
+    lead_name = by_id.get(1, "Cliente não identificado")
+    area = by_id.get(2, "Não informada")
+    situation = by_id.get(3, "Não detalhada")
+    # Phone is the last numeric answer after the intake steps; scan the list
+    # itself since repeated ids collapse in by_id
+    lead_phone = next(
+        (
+            answer.get("answer", "")
+            for answer in reversed(answers)
+            if answer.get("id", 0) >= 4 and answer.get("answer", "").isdigit()
+        ),
+        "Não informado"
+    )
+    
+    return lead_name, lead_phone, area, situation
+
+
 async def _send_notifications_to_lawyers(
     lead_id: str,
     lead_name: str,
@@ -138,62 +218,28 @@ async def _send_notifications_to_lawyers(
     """
     try:
         lawyers = get_lawyers_for_notification()
-        results = []
-        successful_notifications = 0
+        # One clock read per fan-out, shared by the message and every result
+        ts_utc = datetime.now(timezone.utc)
+        timestamp = ts_utc.isoformat()
         
         # Create notification message
-        notification_message = f"""🚨 *Novo Cliente Recebido!*
-
-👤 *Nome:* {lead_name}
-📞 *Telefone:* {lead_phone}
-⚖️ *Área:* {area}
-📝 *Situação:* {situation[:200]}{'...' if len(situation) > 200 else ''}
-
-🆔 *Lead ID:* {lead_id}
-⏰ *Recebido em:* {datetime.now().strftime('%d/%m/%Y às %H:%M')}
-
-_Mensagem enviada automaticamente pelo sistema de captação de leads._"""
+        notification_message = LEAD_NOTIFICATION_TEMPLATE.format(
+            lead_name=lead_name,
+            lead_phone=lead_phone,
+            area=area,
+            situation=_truncate(situation, 200),
+            lead_id=lead_id,
+            received_at=ts_utc.astimezone().strftime('%d/%m/%Y às %H:%M')
+        )
         
-        for lawyer in lawyers:
-            try:
-                lawyer_name = lawyer.get("name", "Advogado")
-                lawyer_phone = lawyer.get("phone", "")
-                
-                if not lawyer_phone:
-                    logger.warning(f"⚠️ No phone number for lawyer {lawyer_name}")
-                    continue
-                
-                # Format phone for WhatsApp
-                whatsapp_number = format_lawyer_phone_for_whatsapp(lawyer_phone)
-                
-                # Send notification
-                success = await baileys_service.send_whatsapp_message(
-                    whatsapp_number,
-                    notification_message
-                )
-                
-                results.append({
-                    "lawyer": lawyer_name,
-                    "phone": lawyer_phone,
-                    "success": success,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
-                
-                if success:
-                    successful_notifications += 1
-                    logger.info(f"✅ Notification sent to {lawyer_name}")
-                else:
-                    logger.error(f"❌ Failed to send notification to {lawyer_name}")
-                    
-            except Exception as lawyer_error:
-                logger.error(f"❌ Error sending notification to {lawyer.get('name', 'Unknown')}: {str(lawyer_error)}")
-                results.append({
-                    "lawyer": lawyer.get("name", "Unknown"),
-                    "phone": lawyer.get("phone", "Unknown"),
-                    "success": False,
-                    "error": str(lawyer_error),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_notify_one(lawyer, notification_message, timestamp))
+                for lawyer in lawyers
+            ]
+        
+        results = [result for result in (task.result() for task in tasks) if result is not None]
+        successful_notifications = sum(1 for result in results if result["success"])
         
         return {
             "success": successful_notifications > 0,
@@ -201,7 +247,7 @@ _Mensagem enviada automaticamente pelo sistema de captação de leads._"""
             "total_lawyers": len(lawyers),
             "results": results,
             "lead_id": lead_id,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": timestamp
         }
         
     except Exception as e:
@@ -213,6 +259,65 @@ _Mensagem enviada automaticamente pelo sistema de captação de leads._"""
         }
 
 
+async def _notify_one(
+    lawyer: Dict[str, Any],
+    notification_message: str,
+    timestamp: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Send the notification message to a single lawyer.
+    
+    Errors are caught and reported in the result so one failing send does
+    not cancel the other notifications in the same fan-out.
+    
+    Args:
+        lawyer (Dict[str, Any]): Lawyer configuration entry
+        notification_message (str): Message to send
+        timestamp (str): ISO timestamp of the fan-out, recorded in the result
+        
+    Returns:
+        Optional[Dict[str, Any]]: Send result, or None if the lawyer has no phone
+    """
+    try:
+        lawyer_name = lawyer.get("name", "Advogado")
+        lawyer_phone = lawyer.get("phone", "")
+        
+        if not lawyer_phone:
+            logger.warning(f"⚠️ No phone number for lawyer {lawyer_name}")
+            return None
+        
+        # Format phone for WhatsApp
+        whatsapp_number = format_lawyer_phone_for_whatsapp(lawyer_phone)
+        
+        # Send notification
+        success = await baileys_service.send_whatsapp_message(
+            whatsapp_number,
+            notification_message
+        )
+        
+        if success:
+            logger.info(f"✅ Notification sent to {lawyer_name}")
+        else:
+            logger.error(f"❌ Failed to send notification to {lawyer_name}")
+        
+        return {
+            "lawyer": lawyer_name,
+            "phone": lawyer_phone,
+            "success": success,
+            "timestamp": timestamp
+        }
+        
+    except Exception as lawyer_error:
+        logger.error(f"❌ Error sending notification to {lawyer.get('name', 'Unknown')}: {str(lawyer_error)}")
+        return {
+            "lawyer": lawyer.get("name", "Unknown"),
+            "phone": lawyer.get("phone", "Unknown"),
+            "success": False,
+            "error": str(lawyer_error),
+            "timestamp": timestamp
+        }
+
+
 async def check_notification_status(lead_id: str) -> Dict[str, Any]:
     """
     Check if a lead has been notified.
@@ -225,7 +330,7 @@ async def check_notification_status(lead_id: str) -> Dict[str, Any]:
     """
     try:
         db = get_firestore_client()
-        lead_doc = db.collection("leads").document(lead_id).get()
+        lead_doc = await asyncio.to_thread(db.collection("leads").document(lead_id).get)
         
         if not lead_doc.exists:
             return {
@@ -267,7 +372,7 @@ async def reset_notification_status(lead_id: str) -> bool:
         db = get_firestore_client()
         lead_ref = db.collection("leads").document(lead_id)
         
-        lead_ref.update({
+        await asyncio.to_thread(lead_ref.update, {
             "was_notified": False,
             "notified_at": None,
             "notification_result": None,
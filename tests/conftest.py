@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+
+@pytest.fixture
+def mock_redis(request):
+    """
+    Mock redis.asyncio client returned by get_redis_client.
+
+    Defaults: SET NX succeeds, GET misses, SETEX/DELETE succeed. Override per
+    test by mutating the returned mocks, or for a whole test/class with indirect
+    parametrisation mapping method name -> AsyncMock kwargs, e.g.
+    @pytest.mark.parametrize("mock_redis", [{"set": {"side_effect": [True, None]}}], indirect=True)
+    """
+    overrides = getattr(request, "param", {})
+    defaults = {
+        "set": {"return_value": True},
+        "get": {"return_value": None},
+        "setex": {"return_value": True},
+        "delete": {"return_value": 1},
+    }
+
+    client = MagicMock()
+    for method, mock_kwargs in defaults.items():
+        setattr(client, method, AsyncMock(**overrides.get(method, mock_kwargs)))
+
+    with patch('app.services.redis_service.get_redis_client', return_value=client):
+        yield client
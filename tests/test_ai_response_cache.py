@@ -0,0 +1,99 @@
+"""
+Tests for the Redis-backed AI reply cache in the WhatsApp orchestration path.
+"""
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.services.orchestration_service import intelligent_orchestrator
+
+
+class TestWhatsAppAIResponseCache:
+    """Test caching of AI replies to opening WhatsApp messages."""
+
+    @pytest.fixture
+    def mock_session_store(self):
+        """Mock Firebase session storage (fresh session by default)."""
+        with patch('app.services.orchestration_service.get_user_session') as mock_get, \
+             patch('app.services.orchestration_service.save_user_session') as mock_save:
+            mock_get.return_value = None
+            mock_save.return_value = True
+            yield {'get': mock_get, 'save': mock_save}
+
+    @pytest.fixture
+    def mock_ai(self):
+        """Mock AI orchestrator."""
+        with patch('app.services.orchestration_service.ai_orchestrator') as mock:
+            mock.generate_response = AsyncMock(return_value="Olá! Como posso ajudar?")
+            mock.add_to_session_memory = MagicMock()
+            yield mock
+
+    @pytest.fixture
+    def mock_cache(self):
+        """Mock Redis cache helpers (miss by default)."""
+        with patch('app.services.orchestration_service.cache_get') as mock_get, \
+             patch('app.services.orchestration_service.cache_set') as mock_set:
+            mock_get.return_value = None
+            mock_set.return_value = True
+            yield {'get': mock_get, 'set': mock_set}
+
+    @pytest.mark.asyncio
+    async def test_fresh_session_cache_hit_skips_llm(self, mock_session_store, mock_ai, mock_cache):
+        """A cached reply is returned without calling the LLM and is kept in session memory."""
+        mock_cache['get'].return_value = "Resposta em cache"
+
+        result = await intelligent_orchestrator.process_message(
+            "Oi", "whatsapp_cache_hit", phone_number="5511999999999@s.whatsapp.net", platform="whatsapp"
+        )
+
+        assert result["response_type"] == "ai_whatsapp"
+        assert result["response"] == "Resposta em cache"
+        mock_ai.generate_response.assert_not_called()
+        mock_ai.add_to_session_memory.assert_called_once_with(
+            "whatsapp_cache_hit", "Oi", "Resposta em cache"
+        )
+        mock_cache['set'].assert_not_called()
+        mock_session_store['save'].assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fresh_session_cache_miss_stores_reply(self, mock_session_store, mock_ai, mock_cache):
+        """On a miss the LLM reply is generated and written to the cache."""
+        result = await intelligent_orchestrator.process_message(
+            "Oi", "whatsapp_cache_miss", phone_number="5511999999999@s.whatsapp.net", platform="whatsapp"
+        )
+
+        assert result["response"] == "Olá! Como posso ajudar?"
+        mock_ai.generate_response.assert_called_once()
+        mock_cache['set'].assert_called_once()
+        key, value, _ttl = mock_cache['set'].call_args[0]
+        assert key == mock_cache['get'].call_args[0][0]
+        assert key.startswith("ai:")
+        assert value == "Olá! Como posso ajudar?"
+
+    @pytest.mark.asyncio
+    async def test_same_key_for_normalized_messages(self, mock_session_store, mock_ai, mock_cache):
+        """Case and surrounding whitespace do not change the cache key."""
+        await intelligent_orchestrator.process_message("Oi", "whatsapp_key_1", platform="whatsapp")
+        await intelligent_orchestrator.process_message("  oi ", "whatsapp_key_2", platform="whatsapp")
+
+        first_key = mock_cache['get'].call_args_list[0][0][0]
+        second_key = mock_cache['get'].call_args_list[1][0][0]
+        assert first_key == second_key
+
+    @pytest.mark.asyncio
+    async def test_ongoing_session_never_reads_cache(self, mock_session_store, mock_ai, mock_cache):
+        """Sessions with prior messages always go to the LLM."""
+        mock_session_store['get'].return_value = {
+            "session_id": "whatsapp_ongoing",
+            "platform": "whatsapp",
+            "lead_data": {},
+            "message_count": 3
+        }
+
+        result = await intelligent_orchestrator.process_message(
+            "Oi", "whatsapp_ongoing", platform="whatsapp"
+        )
+
+        assert result["response"] == "Olá! Como posso ajudar?"
+        mock_cache['get'].assert_not_called()
+        mock_cache['set'].assert_not_called()
+        mock_ai.generate_response.assert_called_once()
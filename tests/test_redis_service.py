@@ -0,0 +1,64 @@
+"""
+Tests for the Redis helpers.
+"""
+
+import pytest
+import redis
+
+from app.services import redis_service
+from app.services.redis_service import set_if_absent
+
+
+class TestSetIfAbsent:
+    """Test SET NX EX semantics and graceful degradation."""
+
+    @pytest.mark.asyncio
+    async def test_first_set_returns_true(self, mock_redis):
+        """Creating a new key reports True."""
+        mock_redis.set.return_value = True
+
+        assert await set_if_absent("wh:msg:abc", 600) is True
+        mock_redis.set.assert_called_once_with("wh:msg:abc", "1", nx=True, ex=600)
+
+    @pytest.mark.asyncio
+    async def test_existing_key_returns_false(self, mock_redis):
+        """redis-py returns None when NX prevents the write."""
+        mock_redis.set.return_value = None
+
+        assert await set_if_absent("wh:msg:abc", 600) is False
+
+    @pytest.mark.asyncio
+    async def test_redis_error_fails_open(self, mock_redis):
+        """Redis errors must not drop messages or block notifications."""
+        mock_redis.set.side_effect = ConnectionError("Redis down")
+
+        assert await set_if_absent("wh:msg:abc", 600) is True
+
+    @pytest.mark.asyncio
+    async def test_redis_timeout_fails_open(self, mock_redis):
+        """A stalled Redis (socket timeout) falls back like any other error."""
+        mock_redis.set.side_effect = redis.exceptions.TimeoutError("Timeout reading from socket")
+
+        assert await set_if_absent("wh:msg:abc", 600) is True
+
+    def test_client_uses_short_socket_timeouts(self, monkeypatch):
+        """The shared client must not wait indefinitely on an unresponsive Redis."""
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        monkeypatch.setattr(redis_service, "_redis_client", None)
+
+        client = redis_service.get_redis_client()
+        connection_kwargs = client.connection_pool.connection_kwargs
+
+        assert connection_kwargs["socket_connect_timeout"] == redis_service.REDIS_CONNECT_TIMEOUT_SECONDS
+        assert connection_kwargs["socket_timeout"] == redis_service.REDIS_SOCKET_TIMEOUT_SECONDS
+        monkeypatch.setattr(redis_service, "_redis_client", None)
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_redis_fails_open(self, monkeypatch):
+        """Without REDIS_URL there is no client and every key counts as new."""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.setattr(redis_service, "_redis_client", None)
+
+        assert redis_service.get_redis_client() is None
+        assert await set_if_absent("wh:msg:abc", 600) is True
+
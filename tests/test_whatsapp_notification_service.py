@@ -0,0 +1,188 @@
+"""
+Tests for the new-lead WhatsApp notification service.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import patch, AsyncMock
+from app.services.whatsapp_notification_service import (
+    send_new_lead_notification,
+    _parse_lead_answers,
+    _send_notifications_to_lawyers
+)
+
+
+class TestNotificationLock:
+    """Test the per-lead Redis lock around lead notification."""
+
+    @pytest.fixture(autouse=True)
+    def whatsapp_enabled(self):
+        """Enable WhatsApp notifications regardless of the environment."""
+        with patch('app.services.whatsapp_notification_service.WHATSAPP_ENABLED', True):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_held_lock_returns_in_progress(self, mock_redis):
+        """A concurrent run for the same lead is skipped before touching Firestore or Baileys."""
+        mock_redis.set.return_value = None
+
+        with patch('app.services.whatsapp_notification_service.get_firestore_client') as mock_db, \
+             patch('app.services.whatsapp_notification_service.baileys_service') as mock_baileys:
+            mock_baileys.send_whatsapp_message = AsyncMock(return_value=True)
+
+            result = await send_new_lead_notification("lead_123", {"answers": []})
+
+            assert result["success"] is False
+            assert result["reason"] == "in_progress"
+            mock_db.assert_not_called()
+            mock_baileys.send_whatsapp_message.assert_not_called()
+
+        mock_redis.set.assert_called_once_with("lock:notify:lead_123", "1", nx=True, ex=60)
+        mock_redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lock_released_when_notification_fails(self, mock_redis):
+        """The lock is deleted in finally even if the notification run raises."""
+        with patch(
+            'app.services.whatsapp_notification_service._notify_new_lead',
+            new=AsyncMock(side_effect=RuntimeError("Firestore unavailable"))
+        ):
+            result = await send_new_lead_notification("lead_123", {"answers": []})
+
+        assert result["success"] is False
+        assert result["reason"] == "error"
+        mock_redis.delete.assert_called_once_with("lock:notify:lead_123")
+
+    @pytest.mark.asyncio
+    async def test_lock_released_after_success(self, mock_redis):
+        """The lock is released once the notification run completes."""
+        with patch(
+            'app.services.whatsapp_notification_service._notify_new_lead',
+            new=AsyncMock(return_value={"success": True, "notifications_sent": 3})
+        ):
+            result = await send_new_lead_notification("lead_123", {"answers": []})
+
+        assert result["notifications_sent"] == 3
+        mock_redis.delete.assert_called_once_with("lock:notify:lead_123")
+
+
+class TestLawyerFanOut:
+    """Test the concurrent lawyer notification fan-out."""
+
+    @pytest.fixture
+    def lawyers(self):
+        """Lawyer config: send raises, send fails, no phone, slow successful send."""
+        return [
+            {"name": "Advogado Erro", "phone": "5511900000001"},
+            {"name": "Advogado Falha", "phone": "5511900000002"},
+            {"name": "Advogado Sem Telefone", "phone": ""},
+            {"name": "Advogado Ok", "phone": "5511900000004"}
+        ]
+
+    @pytest.fixture
+    def mock_baileys(self):
+        """Mock Baileys sends keyed by recipient."""
+        async def send(number, message):
+            if number.startswith("5511900000001"):
+                raise ConnectionError("Baileys unreachable")
+            if number.startswith("5511900000002"):
+                return False
+            # Finishes after the failing sends: would be cancelled if an
+            # error escaped into the TaskGroup
+            await asyncio.sleep(0.01)
+            return True
+
+        with patch('app.services.whatsapp_notification_service.baileys_service') as mock:
+            mock.send_whatsapp_message = AsyncMock(side_effect=send)
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_cancel_other_sends(self, lawyers, mock_baileys):
+        """Errors are reported per lawyer; remaining sends still complete."""
+        with patch(
+            'app.services.whatsapp_notification_service.get_lawyers_for_notification',
+            return_value=lawyers
+        ):
+            result = await _send_notifications_to_lawyers(
+                "lead_123", "João Silva", "11999999999", "Penal", "Processo criminal"
+            )
+
+        assert mock_baileys.send_whatsapp_message.call_count == 3
+        assert result["success"] is True
+        assert result["notifications_sent"] == 1
+        assert result["total_lawyers"] == 4
+
+        # No-phone lawyer is skipped; order follows the lawyer configuration
+        assert [r["lawyer"] for r in result["results"]] == [
+            "Advogado Erro", "Advogado Falha", "Advogado Ok"
+        ]
+        assert [r["success"] for r in result["results"]] == [False, False, True]
+        assert result["results"][0]["error"] == "Baileys unreachable"
+        assert all(r["timestamp"] == result["timestamp"] for r in result["results"])
+
+    @pytest.mark.asyncio
+    async def test_message_time_matches_result_timestamp(self, mock_baileys):
+        """The 'Recebido em' time comes from the same clock read as the results."""
+        with patch(
+            'app.services.whatsapp_notification_service.get_lawyers_for_notification',
+            return_value=[{"name": "Advogado Ok", "phone": "5511900000004"}]
+        ):
+            result = await _send_notifications_to_lawyers(
+                "lead_123", "João Silva", "11999999999", "Penal", "Processo criminal"
+            )
+
+        sent_message = mock_baileys.send_whatsapp_message.call_args[0][1]
+        received_at = datetime.fromisoformat(result["timestamp"]).astimezone()
+        assert f"*Recebido em:* {received_at.strftime('%d/%m/%Y às %H:%M')}" in sent_message
+
+
+class TestParseLeadAnswers:
+    """Test extraction of lead fields from intake answers."""
+
+    def test_standard_intake_answers(self):
+        """Name, area, situation and phone come from their step ids."""
+        answers = [
+            {"id": 1, "answer": "João Silva"},
+            {"id": 2, "answer": "Penal"},
+            {"id": 3, "answer": "Processo criminal"},
+            {"id": 4, "answer": "11999999999"}
+        ]
+
+        assert _parse_lead_answers(answers) == (
+            "João Silva", "11999999999", "Penal", "Processo criminal"
+        )
+
+    def test_defaults_when_answers_missing(self):
+        """Missing steps fall back to the placeholder texts."""
+        assert _parse_lead_answers([]) == (
+            "Cliente não identificado", "Não informado", "Não informada", "Não detalhada"
+        )
+
+    def test_phone_is_last_numeric_answer(self):
+        """A repeated step id does not change which numeric answer is the phone."""
+        answers = [
+            {"id": 4, "answer": "123"},
+            {"id": 5, "answer": "456"},
+            {"id": 4, "answer": "789"}
+        ]
+
+        assert _parse_lead_answers(answers)[1] == "789"
+
+    def test_phone_skips_later_non_numeric_answer(self):
+        """A non-numeric answer reusing the phone step id does not hide the phone."""
+        answers = [
+            {"id": 4, "answer": "123"},
+            {"id": 4, "answer": "abc"}
+        ]
+
+        assert _parse_lead_answers(answers)[1] == "123"
+
+    def test_numeric_answers_before_step_four_are_not_phone(self):
+        """Only answers from step 4 onwards are phone candidates."""
+        answers = [
+            {"id": 1, "answer": "12345"},
+            {"id": 4, "answer": "Sim"}
+        ]
+
+        assert _parse_lead_answers(answers)[1] == "Não informado"
@@ -0,0 +1,160 @@
+"""
+Tests for the WhatsApp webhook route.
+"""
+
+import orjson
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi import BackgroundTasks
+
+from app.routes.whatsapp import whatsapp_webhook, _process_and_reply
+from app.services.baileys_service import BaileysWhatsAppService
+
+
+def make_webhook_request(payload: bytes) -> MagicMock:
+    """Build a minimal Request double exposing the raw body."""
+    request = MagicMock()
+    request.body = AsyncMock(return_value=payload)
+    return request
+
+
+# First SET NX succeeds, later ones find the key
+@pytest.mark.parametrize("mock_redis", [{"set": {"side_effect": [True, None]}}], indirect=True)
+class TestWebhookDeduplication:
+    """Test messageId-based replay deduplication in the webhook."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_message_id_is_duplicate(self, mock_redis):
+        """The second delivery of a messageId is acknowledged but not processed."""
+        payload = b'{"message": "Oi", "from": "5511999999999@s.whatsapp.net", "messageId": "MSG1"}'
+
+        first_tasks = BackgroundTasks()
+        first = await whatsapp_webhook(make_webhook_request(payload), first_tasks)
+        assert first.status_code == 202
+        assert len(first_tasks.tasks) == 1
+
+        second_tasks = BackgroundTasks()
+        second = await whatsapp_webhook(make_webhook_request(payload), second_tasks)
+        assert second == {"status": "duplicate", "message_id": "MSG1"}
+        assert len(second_tasks.tasks) == 0
+
+        assert mock_redis.set.call_args_list[0][0][0] == "wh:msg:MSG1"
+
+    @pytest.mark.asyncio
+    async def test_missing_message_id_skips_dedup(self, mock_redis):
+        """Messages without a messageId are always processed."""
+        payload = b'{"message": "Oi", "from": "5511999999999@s.whatsapp.net"}'
+
+        tasks = BackgroundTasks()
+        response = await whatsapp_webhook(make_webhook_request(payload), tasks)
+
+        assert response.status_code == 202
+        assert len(tasks.tasks) == 1
+        mock_redis.set.assert_not_called()
+
+
+class TestWebhookBackgroundReply:
+    """Test that the background task replies to the sender through Baileys."""
+
+    @pytest.fixture
+    def mock_orchestrator(self):
+        """Mock Intelligent Orchestrator."""
+        with patch('app.routes.whatsapp.intelligent_orchestrator') as mock:
+            mock.process_message = AsyncMock(return_value={"response": "Olá! Como posso ajudar?"})
+            yield mock
+
+    @pytest.fixture
+    def mock_send(self):
+        """Mock Baileys send used by the background reply."""
+        with patch('app.routes.whatsapp.send_baileys_message', new=AsyncMock(return_value=True)) as mock:
+            yield mock
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sender", [
+        "5511999999999@s.whatsapp.net",
+        "120363025246125486@g.us",
+        "178112683815053@lid",
+    ])
+    async def test_reply_sent_to_unmodified_sender_jid(self, mock_redis, mock_orchestrator, mock_send, sender):
+        """The AI reply goes to the raw 'from' JID, whatever its server part."""
+        payload = orjson.dumps({"message": "Oi", "from": sender, "messageId": "MSG1"})
+
+        tasks = BackgroundTasks()
+        response = await whatsapp_webhook(make_webhook_request(payload), tasks)
+        assert response.status_code == 202
+        await tasks()
+
+        mock_orchestrator.process_message.assert_called_once()
+        mock_send.assert_called_once_with(sender, "Olá! Como posso ajudar?")
+
+    @pytest.mark.asyncio
+    async def test_empty_ai_response_sends_fallback(self, mock_orchestrator, mock_send):
+        """An empty AI reply is replaced by the thank-you fallback."""
+        mock_orchestrator.process_message.return_value = {"response": ""}
+
+        await _process_and_reply("Oi", "whatsapp_5511999999999", "5511999999999@s.whatsapp.net")
+
+        sent_to, sent_text = mock_send.call_args[0]
+        assert sent_to == "5511999999999@s.whatsapp.net"
+        assert sent_text.startswith("Obrigado pela sua mensagem")
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_error_sends_error_message(self, mock_orchestrator, mock_send):
+        """An orchestrator exception still produces a reply to the user."""
+        mock_orchestrator.process_message.side_effect = Exception("Gemini timeout")
+
+        await _process_and_reply("Oi", "whatsapp_5511999999999", "5511999999999@s.whatsapp.net")
+
+        sent_to, sent_text = mock_send.call_args[0]
+        assert sent_to == "5511999999999@s.whatsapp.net"
+        assert sent_text.startswith("Desculpe, ocorreu um erro interno")
+
+    @pytest.mark.asyncio
+    async def test_malformed_body_returns_500(self, mock_orchestrator, mock_send):
+        """Webhook-level failures return 5xx so the bot sends its own fallback."""
+        tasks = BackgroundTasks()
+        response = await whatsapp_webhook(make_webhook_request(b"{not json"), tasks)
+
+        assert response.status_code == 500
+        body = orjson.loads(response.body)
+        assert body["status"] == "error"
+        assert "response" not in body
+        assert len(tasks.tasks) == 0
+        mock_send.assert_not_called()
+
+
+class TestBaileysRecipientNormalization:
+    """Test recipient handling in BaileysWhatsAppService.send_whatsapp_message."""
+
+    @pytest.fixture
+    def service(self):
+        """Service with a mocked HTTP client capturing the posted body."""
+        service = BaileysWhatsAppService(base_url="http://whatsapp_bot:3000")
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"success": True}
+        client = MagicMock()
+        client.post = AsyncMock(return_value=response)
+        with patch.object(service, '_get_client', return_value=client):
+            yield service, client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("jid", [
+        "5511999999999@s.whatsapp.net",
+        "120363025246125486@g.us",
+        "178112683815053@lid",
+    ])
+    async def test_jids_are_passed_through(self, service, jid):
+        """Anything that already contains '@' is sent unchanged."""
+        baileys, client = service
+
+        assert await baileys.send_whatsapp_message(jid, "Oi") is True
+        assert orjson.loads(client.post.call_args.kwargs["content"])["to"] == jid
+
+    @pytest.mark.asyncio
+    async def test_bare_phone_is_normalized(self, service):
+        """Bare numbers get the country code and WhatsApp suffix."""
+        baileys, client = service
+
+        await baileys.send_whatsapp_message("(11) 99999-9999", "Oi")
+
+        assert orjson.loads(client.post.call_args.kwargs["content"])["to"] == "5511999999999@s.whatsapp.net"